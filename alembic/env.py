@@ -1,30 +1,13 @@
+import asyncio
 import os
 from logging.config import fileConfig
 
 from dotenv import load_dotenv
-from sqlalchemy import engine_from_config, make_url, pool
+from sqlalchemy import Connection, MetaData, make_url, pool
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
-# Import all models that should be included in migrations
-from src.models.api_key import ApiKey  # noqa
-from src.models.auth_code import AuthCode  # noqa
-from src.models.base import Base  # Import the Base from your models
-from src.models.chat_request import ChatRequest  # noqa
-from src.models.credit_transaction import CreditTransaction  # noqa
-from src.models.entitlement_window import EntitlementWindow  # noqa
-from src.models.inference_call import InferenceCall  # noqa
-from src.models.liberclaw_credit_grant import LiberclawCreditGrant  # noqa
-from src.models.liberclaw_user import LiberclawUser  # noqa
-from src.models.magic_link import MagicLink  # noqa
-from src.models.oauth_connection import OAuthConnection  # noqa
-from src.models.plan_subscription import PlanSubscription  # noqa
-from src.models.plan_subscription_event import PlanSubscriptionEvent  # noqa
-from src.models.session import Session  # noqa
-from src.models.user import User  # noqa
-from src.models.wallet_challenge import WalletChallenge  # noqa
-from src.models.wallet_connection import WalletConnection  # noqa
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -41,9 +24,43 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL)
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+
+def _load_metadata() -> MetaData | None:
+    """Import the models only when the command compares against them.
+
+    Only autogenerate (``revision --autogenerate``) and ``check`` read target_metadata;
+    importing src.models also pulls in the app config and engine, which plain upgrades
+    (the boot script, the migration tests) don't need.
+    """
+    cmd_opts = config.cmd_opts
+    if cmd_opts is None or not (getattr(cmd_opts, "autogenerate", False) or cmd_opts.cmd[0].__name__ == "check"):
+        return None
+
+    # Import all models that should be included in migrations
+    from src.models.api_key import ApiKey  # noqa
+    from src.models.auth_code import AuthCode  # noqa
+    from src.models.base import Base
+    from src.models.chat_request import ChatRequest  # noqa
+    from src.models.credit_transaction import CreditTransaction  # noqa
+    from src.models.entitlement_window import EntitlementWindow  # noqa
+    from src.models.inference_call import InferenceCall  # noqa
+    from src.models.liberclaw_credit_grant import LiberclawCreditGrant  # noqa
+    from src.models.liberclaw_user import LiberclawUser  # noqa
+    from src.models.magic_link import MagicLink  # noqa
+    from src.models.oauth_connection import OAuthConnection  # noqa
+    from src.models.plan_subscription import PlanSubscription  # noqa
+    from src.models.plan_subscription_event import PlanSubscriptionEvent  # noqa
+    from src.models.session import Session  # noqa
+    from src.models.user import User  # noqa
+    from src.models.wallet_challenge import WalletChallenge  # noqa
+    from src.models.wallet_connection import WalletConnection  # noqa
+
+    return Base.metadata
+
+
 # add your model's MetaData object here
 # for 'autogenerate' support
-target_metadata = Base.metadata
+target_metadata = _load_metadata()
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -75,24 +92,46 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Run migrations through the async engine (psycopg v3, same driver as the app).
+
+    Alembic itself is synchronous, so the migrations run on the sync facade of the
+    async connection via run_sync; the event loop stays free while statements are in flight.
 
     """
-    connectable = engine_from_config(
+    # A single pooled connection (pre-pinged) is reused for the whole run instead of NullPool
+    # reconnecting; the engine is disposed afterwards so nothing lingers once we're done.
+    connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    try:
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await connectable.dispose()
 
-        with context.begin_transaction():
-            context.run_migrations()
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    In this scenario we need to create an Engine
+    and associate a connection with the context.
+
+    """
+    asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
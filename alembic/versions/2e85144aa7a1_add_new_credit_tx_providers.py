@@ -19,9 +19,10 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade schema and rename enum values."""
-    op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'ltai_base';")
-    op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'ltai_solana';")
-    op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'sol_solana';")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'ltai_base';")
+        op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'ltai_solana';")
+        op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'sol_solana';")
 
 
 def downgrade() -> None:
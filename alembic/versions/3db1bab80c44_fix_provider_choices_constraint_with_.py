@@ -23,10 +23,13 @@ def upgrade() -> None:
     op.drop_constraint("check_provider_choices", "credit_transactions", type_="check")
 
     # Add the new constraint with proper text casting
+    # NOT VALID skips the full-table validation scan; f1a2b3c4d5e6 re-creates these
+    # constraints as plain (validated) ones once the provider set settles.
     op.create_check_constraint(
         "check_provider_choices",
         "credit_transactions",
         "provider::text IN ('libertai', 'thirdweb', 'voucher', 'solana')",
+        postgresql_not_valid=True,
     )
 
 
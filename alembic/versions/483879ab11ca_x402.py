@@ -18,7 +18,8 @@ depends_on: str | Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    op.execute("ALTER TYPE apikeytype ADD VALUE IF NOT EXISTS 'x402'")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE apikeytype ADD VALUE IF NOT EXISTS 'x402'")
 
 
 def downgrade() -> None:
@@ -23,10 +23,13 @@ def upgrade() -> None:
     op.drop_constraint("check_block_number_required_for_provider_libertai", "credit_transactions", type_="check")
 
     # Add the new constraint with proper text casting
+    # NOT VALID skips the full-table validation scan; f1a2b3c4d5e6 re-creates these
+    # constraints as plain (validated) ones once the provider set settles.
     op.create_check_constraint(
         "check_block_number_required_for_provider_libertai",
         "credit_transactions",
         "(provider::text = 'thirdweb' OR provider::text = 'voucher') OR (provider::text = 'libertai' AND block_number IS NOT NULL) OR (provider::text = 'solana' AND block_number IS NOT NULL)",
+        postgresql_not_valid=True,
     )
 
 
@@ -8,7 +8,9 @@ Create Date: 2025-08-12 15:00:46.109850
 
 from collections.abc import Sequence
 
-from alembic import op
+import sqlalchemy as sa
+
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision: str = "659d90b9b412"
@@ -16,18 +18,137 @@ down_revision: str | None = "cc25520c6876"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+# Short-lived indexes backing the dedup CTE (grouped on LOWER(address)) and the per-table
+# sweeps, so neither has to seq-scan; dropped again once the normalization is done. The sweep
+# indexes only cover rows that still need lowercasing, usually a small subset of each table.
+TEMPORARY_INDEXES = {
+    "tmp_users_lower_address": "users (LOWER(address)) WHERE address LIKE '0x%'",
+    "tmp_users_mixed_case_address": "users (address) WHERE address LIKE '0x%' AND address <> LOWER(address)",
+    "tmp_credit_transactions_address": (
+        "credit_transactions (address) WHERE address LIKE '0x%' AND address <> LOWER(address)"
+    ),
+    "tmp_api_keys_user_address": (
+        "api_keys (user_address) WHERE user_address LIKE '0x%' AND user_address <> LOWER(user_address)"
+    ),
+    "tmp_subscriptions_user_address": (
+        "subscriptions (user_address) WHERE user_address LIKE '0x%' AND user_address <> LOWER(user_address)"
+    ),
+    "tmp_agents_user_address": (
+        "agents (user_address) WHERE user_address LIKE '0x%' AND user_address <> LOWER(user_address)"
+    ),
+}
+
+# Address columns to lowercase, users (primary key) first then all foreign key tables
+ADDRESS_COLUMNS = [
+    ("users", "address"),
+    ("credit_transactions", "address"),
+    ("api_keys", "user_address"),
+    ("subscriptions", "user_address"),
+    ("agents", "user_address"),
+]
+
+# Foreign keys on users.address, dropped for the normalization (so deleting duplicate users
+# doesn't cascade) and re-added NOT VALID afterwards, then validated without blocking writes.
+FOREIGN_KEYS = {
+    "credit_transactions_address_fkey": ("credit_transactions", "address"),
+    "api_keys_user_address_fkey": ("api_keys", "user_address"),
+    "subscriptions_user_address_fkey": ("subscriptions", "user_address"),
+    "agents_user_address_fkey": ("agents", "user_address"),
+}
+
+# Session settings for the bulk work. Session-level (not SET LOCAL) because the sweep commits
+# batch by batch outside the migration transaction; reset once the migration is done.
+# temp_buffers has to be set before the session first touches a temporary table.
+SESSION_SETTINGS = {
+    "synchronous_commit": "off",
+    "work_mem": "'256MB'",
+    "maintenance_work_mem": "'1GB'",
+    "temp_buffers": "'256MB'",
+}
+
+# Rows rewritten per statement by the lowercase sweep. Each batch commits on its own, so a large
+# table is never rewritten (row locks, WAL, dead tuples) in a single transaction.
+SWEEP_BATCH_SIZE = 10_000
+
+
+def _lowercase_addresses(table: str, column: str) -> None:
+    """Lowercase the ``0x`` addresses of ``table.column`` in batches until none are left."""
+    if context.is_offline_mode():
+        # No result rowcount to loop on when rendering SQL
+        op.execute(
+            f"UPDATE {table} SET {column} = LOWER({column}) WHERE {column} LIKE '0x%' AND {column} <> LOWER({column})"
+        )
+        return
+
+    # Rows already lowercased drop out of the predicate, so it doubles as the batch cursor
+    batch = sa.text(f"""
+        UPDATE {table}
+        SET {column} = LOWER({column})
+        WHERE ctid = ANY(ARRAY(
+            SELECT ctid FROM {table}
+            WHERE {column} LIKE '0x%' AND {column} <> LOWER({column})
+            LIMIT :batch_size
+        ))
+    """)
+    bind = op.get_bind()
+    while bind.execute(batch, {"batch_size": SWEEP_BATCH_SIZE}).rowcount > 0:
+        pass
+
+
+def _drop_secondary_indexes() -> list[str]:
+    """Drop the plain (non-unique, non-PK) indexes of the swept tables and return their DDL.
+
+    Every lowercased row would otherwise insert a new entry into each of them; rebuilding
+    once after the sweep is a single sort per index. The temporary sweep indexes are kept.
+    """
+    if context.is_offline_mode():
+        return []  # Nothing to introspect when rendering SQL
+
+    query = sa.text("""
+        SELECT i.relname, pg_get_indexdef(ix.indexrelid)
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        JOIN pg_class t ON t.oid = ix.indrelid
+        WHERE t.relname = ANY(:tables)
+          AND pg_table_is_visible(t.oid)
+          AND NOT ix.indisunique
+          AND NOT ix.indisprimary
+          AND NOT i.relname = ANY(:keep)
+    """)
+    params = {"tables": [table for table, _ in ADDRESS_COLUMNS], "keep": list(TEMPORARY_INDEXES)}
+    rows = op.get_bind().execute(query, params).all()
+    for name, _ in rows:
+        op.execute(f"DROP INDEX {name}")
+    return [definition for _, definition in rows]
+
 
 def upgrade() -> None:
     """Normalize all Ethereum addresses (starting with 0x) to lowercase, handling duplicates and foreign keys."""
 
-    # Step 1: Temporarily disable foreign key constraints
-    op.execute("SET session_replication_role = replica;")
+    for name, value in SESSION_SETTINGS.items():
+        op.execute(f"SET {name} = {value}")
 
     try:
+        for name, definition in TEMPORARY_INDEXES.items():
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+        # Step 1: Temporarily drop the foreign key constraints
+        for name, (table, _) in FOREIGN_KEYS.items():
+            op.drop_constraint(name, table, type_="foreignkey")
+
         # Step 2: Handle duplicate users with case-insensitive addresses
-        # Create a temporary table to track which addresses to merge
+        # Create a temporary table to track which addresses to merge. Declared up front so
+        # old_address gets a primary key for the DELETE join below; it only lives until the
+        # transaction commits (right before the autocommit sweep).
         op.execute("""
-            CREATE TEMPORARY TABLE duplicate_address_mapping AS
+            CREATE TEMPORARY TABLE duplicate_address_mapping (
+                old_address VARCHAR PRIMARY KEY,
+                keep_address VARCHAR NOT NULL,
+                lowercase_address VARCHAR NOT NULL
+            ) ON COMMIT DROP
+        """)
+        op.execute("""
+            INSERT INTO duplicate_address_mapping (old_address, keep_address, lowercase_address)
             WITH ranked_users AS (
                 SELECT 
                     address,
@@ -55,71 +176,51 @@ def upgrade() -> None:
             JOIN ranked_users keep_user ON old_user.lowercase_address = keep_user.lowercase_address
             WHERE old_user.rn > 1 AND keep_user.rn = 1
         """)
+        # Temporary tables are never auto-analyzed; give the planner real row counts
+        op.execute("ANALYZE duplicate_address_mapping")
 
-        # Step 3: Update all foreign key references to point to the address we're keeping
-        # Update credit_transactions
-        op.execute("""
-            UPDATE credit_transactions 
-            SET address = dam.keep_address
-            FROM duplicate_address_mapping dam
-            WHERE credit_transactions.address = dam.old_address
-        """)
-
-        # Update api_keys
-        op.execute("""
-            UPDATE api_keys 
-            SET user_address = dam.keep_address
-            FROM duplicate_address_mapping dam
-            WHERE api_keys.user_address = dam.old_address
-        """)
-
-        # Update subscriptions
-        op.execute("""
-            UPDATE subscriptions 
-            SET user_address = dam.keep_address
-            FROM duplicate_address_mapping dam
-            WHERE subscriptions.user_address = dam.old_address
-        """)
-
-        # Step 4: Delete duplicate user records
+        # Step 3: Delete duplicate user records
+        # Joined rather than IN (...): the small, analyzed mapping table drives the loop
         op.execute("""
             DELETE FROM users
-            WHERE address IN (SELECT old_address FROM duplicate_address_mapping)
-        """)
-
-        # Step 5: Now normalize all addresses to lowercase
-        # Update users table first (primary key)
-        op.execute("""
-            UPDATE users 
-            SET address = LOWER(address) 
-            WHERE address LIKE '0x%'
-        """)
-
-        # Update all foreign key tables
-        op.execute("""
-            UPDATE credit_transactions 
-            SET address = LOWER(address) 
-            WHERE address LIKE '0x%'
-        """)
-
-        op.execute("""
-            UPDATE api_keys 
-            SET user_address = LOWER(user_address) 
-            WHERE user_address LIKE '0x%'
-        """)
-
-        op.execute("""
-            UPDATE subscriptions 
-            SET user_address = LOWER(user_address) 
-            WHERE user_address LIKE '0x%'
+            USING duplicate_address_mapping dam
+            WHERE users.address = dam.old_address
         """)
 
         # Clean up temporary table
         op.execute("DROP TABLE IF EXISTS duplicate_address_mapping")
 
+        # Step 4: Now normalize all addresses to lowercase
+        # A duplicate and the user we keep share the same LOWER(address), so lowercasing the
+        # referencing rows also re-points them to the kept user: one pass per table instead of
+        # a separate remap UPDATE followed by a lowercase UPDATE.
+        # The index and foreign key drops commit together with the dedup when the autocommit
+        # block starts, so they only need restoring (whatever happens to the sweep) once inside it.
+        dropped_indexes = _drop_secondary_indexes()
+        with op.get_context().autocommit_block():
+            try:
+                for table, column in ADDRESS_COLUMNS:
+                    _lowercase_addresses(table, column)
+            finally:
+                for definition in dropped_indexes:
+                    op.execute(definition.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1))
+
+                # Step 5: Re-add the foreign key constraints. NOT VALID only needs a brief lock...
+                for name, (table, column) in FOREIGN_KEYS.items():
+                    op.execute(
+                        f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+                        "REFERENCES users (address) ON DELETE CASCADE NOT VALID"
+                    )
+
+            # ...and validation scans under SHARE UPDATE EXCLUSIVE, leaving reads and writes running
+            for name, (table, _) in FOREIGN_KEYS.items():
+                op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
     finally:
-        # Step 6: Re-enable foreign key constraints
-        op.execute("SET session_replication_role = DEFAULT;")
+        for name in SESSION_SETTINGS:
+            op.execute(f"RESET {name}")
+        for name in TEMPORARY_INDEXES:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
 
 
 def downgrade() -> None:
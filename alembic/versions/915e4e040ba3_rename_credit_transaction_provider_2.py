@@ -8,7 +8,6 @@ Create Date: 2025-07-19 16:42:51.705280
 
 from collections.abc import Sequence
 
-import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
 from alembic import op
@@ -22,6 +21,11 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade schema and rename enum values."""
+    # Transaction-scoped tuning for the full-table UPDATE below: no fsync wait on its commit
+    # and room to sort/hash in memory. Nothing leaks to other sessions.
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL work_mem = '256MB'")
+
     # Drop the old constraint
     op.drop_constraint("check_block_number_required_for_provider_libertai", "credit_transactions", type_="check")
     # Drop the old constraint
@@ -30,41 +34,32 @@ def upgrade() -> None:
     # 1. Update existing data
     op.execute("UPDATE credit_transactions SET provider = 'base' WHERE provider = 'libertai';")
 
-    # 2. Create new enum types
-    credit_transaction_provider = sa.Enum("base", "thirdweb", "voucher", "solana", name="credittransactionprovider")
-    credit_transaction_provider.create(op.get_bind(), checkfirst=True)
-
-    credit_transaction_status = sa.Enum("pending", "completed", "error", name="credittransactionstatus")
-    credit_transaction_status.create(op.get_bind(), checkfirst=True)
-
-    # 3. Alter columns to use new enums
-    op.execute("""
-            ALTER TABLE credit_transactions
-            ALTER COLUMN provider TYPE credittransactionprovider
-            USING provider::text::credittransactionprovider;
-        """)
-
-    op.execute("""
-        ALTER TABLE credit_transactions
-        ALTER COLUMN status TYPE credittransactionstatus
-        USING status::text::credittransactionstatus;
-    """)
+    # 2. Rename the enum types in place instead of creating new ones and moving the columns over
+    # with ALTER COLUMN ... USING, which rewrites the whole table under an exclusive lock. The
+    # unused 'libertai' label stays on the type; the check constraint below rejects it.
+    op.execute("ALTER TYPE transactionprovider RENAME TO credittransactionprovider;")
+    op.execute("ALTER TYPE transactionstatus RENAME TO credittransactionstatus;")
 
-    # 4. Drop old enum types
-    op.execute("DROP TYPE transactionprovider;")
-    op.execute("DROP TYPE transactionstatus;")
+    # 3. Add the missing values
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'solana';")
+        op.execute("ALTER TYPE credittransactionstatus ADD VALUE IF NOT EXISTS 'error';")
 
     # Add the new constraint with proper text casting
+    # NOT VALID skips the full-table validation scan; f1a2b3c4d5e6 re-creates these
+    # constraints as plain (validated) ones once the provider set settles.
     op.create_check_constraint(
         "check_block_number_required_for_provider_libertai",
         "credit_transactions",
         "(provider::text = 'thirdweb' OR provider::text = 'voucher') OR (provider::text = 'base' AND block_number IS NOT NULL) OR (provider::text = 'solana' AND block_number IS NOT NULL)",
+        postgresql_not_valid=True,
     )
     # Add the new constraint with proper text casting
     op.create_check_constraint(
         "check_provider_choices",
         "credit_transactions",
         "provider::text IN ('base', 'thirdweb', 'voucher', 'solana')",
+        postgresql_not_valid=True,
     )
 
 
@@ -76,7 +71,8 @@ def downgrade() -> None:
     op.drop_constraint("check_provider_choices", "credit_transactions", type_="check")
 
     # 1. Add libertai back (needed for data update)
-    op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'libertai';")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'libertai';")
 
     # 2. Revert 'base' to 'libertai'
     op.execute("UPDATE credit_transactions SET provider = 'libertai' WHERE provider = 'base';")
@@ -19,7 +19,8 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade():
     """Add 'base' value to transactionprovider enum to allow safe update."""
-    op.execute("ALTER TYPE transactionprovider ADD VALUE IF NOT EXISTS 'base';")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE transactionprovider ADD VALUE IF NOT EXISTS 'base';")
 
 
 def downgrade():
@@ -0,0 +1,34 @@
+"""inference_calls.id as BIGINT
+
+Revision ID: a4c6e8f0b2d1
+Revises: f3b8d1e6a2c4
+Create Date: 2026-10-16
+
+inference_calls gets one row per API call and its serial id is a 4-byte integer: both the
+column and its sequence top out at 2^31 - 1, after which every insert fails. Widen both
+to 8 bytes. The column change rewrites the table (and rebuilds its indexes) once.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c6e8f0b2d1"
+down_revision: str | None = "f3b8d1e6a2c4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+    op.execute("ALTER TABLE inference_calls ALTER COLUMN id TYPE BIGINT")
+    op.execute("ALTER SEQUENCE inference_calls_id_seq AS BIGINT")
+
+
+def downgrade() -> None:
+    # Fails if ids past the 4-byte range were already handed out
+    op.execute("ALTER SEQUENCE inference_calls_id_seq AS INTEGER")
+    op.execute("ALTER TABLE inference_calls ALTER COLUMN id TYPE INTEGER")
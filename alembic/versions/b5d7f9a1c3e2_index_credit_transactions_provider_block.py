@@ -0,0 +1,49 @@
+"""index credit_transactions (provider, block_number)
+
+Revision ID: b5d7f9a1c3e2
+Revises: a4c6e8f0b2d1
+Create Date: 2026-10-16
+
+Every Base and Solana poll starts from the highest block_number recorded for its
+provider(s). With no index on block_number that lookup scanned the whole table on each
+tick. Partial on block_number IS NOT NULL: only the onchain providers carry one, so fiat,
+voucher and Thirdweb rows stay out of the index. Created CONCURRENTLY to avoid locking
+writes.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d7f9a1c3e2"
+down_revision: str | None = "a4c6e8f0b2d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "ix_credit_transactions_provider_block_number"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "credit_transactions",
+            ["provider", "block_number"],
+            unique=False,
+            postgresql_where=sa.text("block_number IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="credit_transactions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
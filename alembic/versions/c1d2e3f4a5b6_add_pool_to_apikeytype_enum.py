@@ -19,7 +19,8 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    op.execute("ALTER TYPE apikeytype ADD VALUE IF NOT EXISTS 'pool'")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE apikeytype ADD VALUE IF NOT EXISTS 'pool'")
 
 
 def downgrade() -> None:
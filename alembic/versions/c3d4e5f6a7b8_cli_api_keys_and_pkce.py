@@ -22,7 +22,8 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     """Upgrade schema."""
     # New 'cli' value on the ApiKeyType enum (used by CLI-minted keys).
-    op.execute("ALTER TYPE apikeytype ADD VALUE IF NOT EXISTS 'cli'")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE apikeytype ADD VALUE IF NOT EXISTS 'cli'")
     # Optional key expiry (CLI keys must be re-minted via `libertai login`).
     op.add_column("api_keys", sa.Column("expires_at", sa.TIMESTAMP(), nullable=True))
     # PKCE challenge stored with the one-time auth code (CLI loopback flow).
@@ -8,7 +8,6 @@ Create Date: 2025-08-04 17:18:56.566591
 
 from collections.abc import Sequence
 
-import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
 from alembic import op
@@ -22,6 +21,11 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Upgrade schema."""
+    # Both provider UPDATEs touch most of credit_transactions; skip the commit fsync wait and
+    # give them more working memory, for this transaction only.
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL work_mem = '256MB'")
+
     # Drop the old constraint
     op.drop_constraint("check_block_number_required_for_provider_libertai", "credit_transactions", type_="check")
     # Drop the old constraint
@@ -31,30 +35,24 @@ def upgrade() -> None:
     op.execute("UPDATE credit_transactions SET provider = 'ltai_base' WHERE provider = 'base';")
     op.execute("UPDATE credit_transactions SET provider = 'ltai_solana' WHERE provider = 'solana';")
 
-    # 2. Create new enum types
-    credit_transaction_provider = sa.Enum(
-        "ltai_base", "ltai_solana", "thirdweb", "voucher", "sol_solana", name="credittransactionprovider"
-    )
-    credit_transaction_provider.create(op.get_bind(), checkfirst=True)
-
-    # 3. Alter columns to use new enum
-    op.execute("""
-            ALTER TABLE credit_transactions
-            ALTER COLUMN provider TYPE credittransactionprovider
-            USING provider::text::credittransactionprovider;
-        """)
+    # The column already uses credittransactionprovider and 2e85144aa7a1 added the new values
+    # to it, so moving the rows over is enough: no new type, no ALTER COLUMN ... USING rewrite.
 
     # Add the new constraint with proper text casting
+    # NOT VALID skips the full-table validation scan; f1a2b3c4d5e6 re-creates these
+    # constraints as plain (validated) ones once the provider set settles.
     op.create_check_constraint(
         "check_block_number_required",
         "credit_transactions",
         "(provider::text = 'thirdweb' OR provider::text = 'voucher') OR (provider::text = 'ltai_base' AND block_number IS NOT NULL) OR (provider::text = 'ltai_solana' AND block_number IS NOT NULL) OR (provider::text = 'sol_solana' AND block_number IS NOT NULL)",
+        postgresql_not_valid=True,
     )
     # Add the new constraint with proper text casting
     op.create_check_constraint(
         "check_provider_choices",
         "credit_transactions",
         "provider::text IN ('ltai_base', 'ltai_solana', 'thirdweb', 'voucher', 'sol_solana')",
+        postgresql_not_valid=True,
     )
 
 
@@ -66,7 +64,8 @@ def downgrade() -> None:
     op.drop_constraint("check_provider_choices", "credit_transactions", type_="check")
 
     # 1. Add libertai back (needed for data update)
-    op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'libertai';")
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE credittransactionprovider ADD VALUE IF NOT EXISTS 'libertai';")
 
     # 2. Revert 'ltai_base' to 'base' and 'ltai_solana' to 'solana'
     op.execute("UPDATE credit_transactions SET provider = 'base' WHERE provider = 'ltai_base';")
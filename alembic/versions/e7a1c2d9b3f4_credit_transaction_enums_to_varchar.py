@@ -0,0 +1,83 @@
+"""credit transaction provider/status as varchar
+
+Revision ID: e7a1c2d9b3f4
+Revises: d64e36784e9f
+Create Date: 2026-10-16
+
+``provider`` and ``status`` move from native PG enums to ``VARCHAR(32)`` guarded by check
+constraints. Every new provider used to mean a text/enum round-trip rewriting the whole
+table under an exclusive lock; from now on it's a drop + ``NOT VALID`` re-add of the check.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a1c2d9b3f4"
+down_revision: str | None = "d64e36784e9f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PROVIDERS = ("ltai_base", "ltai_solana", "thirdweb", "voucher", "sol_solana", "revolut")
+STATUSES = ("pending", "completed", "error")
+
+CHECK_CONSTRAINTS = {
+    "check_provider_choices": f"provider IN ({', '.join(repr(p) for p in PROVIDERS)})",
+    "check_status_choices": f"status IN ({', '.join(repr(s) for s in STATUSES)})",
+    "check_block_number_required": (
+        "(provider::text = 'thirdweb' OR provider::text = 'voucher' OR provider::text = 'revolut') "
+        "OR (provider::text = 'ltai_base' AND block_number IS NOT NULL) "
+        "OR (provider::text = 'ltai_solana' AND block_number IS NOT NULL) "
+        "OR (provider::text = 'sol_solana' AND block_number IS NOT NULL)"
+    ),
+}
+
+
+def upgrade() -> None:
+    # The type change rewrites the table and rebuilds every index on it
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+    op.drop_constraint("check_block_number_required", "credit_transactions", type_="check")
+    op.drop_constraint("check_provider_choices", "credit_transactions", type_="check")
+
+    # Last rewrite of the table for these columns: both conversions happen in one ALTER TABLE pass.
+    op.execute(
+        "ALTER TABLE credit_transactions "
+        "ALTER COLUMN provider TYPE VARCHAR(32) USING provider::text, "
+        "ALTER COLUMN status TYPE VARCHAR(32) USING status::text"
+    )
+    op.execute("DROP TYPE credittransactionprovider")
+    op.execute("DROP TYPE credittransactionstatus")
+
+    # Added NOT VALID so no scan happens under the rewrite's exclusive lock...
+    for name, condition in CHECK_CONSTRAINTS.items():
+        op.create_check_constraint(name, "credit_transactions", condition, postgresql_not_valid=True)
+
+    # ...then validated once that lock is released (VALIDATE only blocks schema changes, not writes).
+    with op.get_context().autocommit_block():
+        for name in CHECK_CONSTRAINTS:
+            op.execute(f"ALTER TABLE credit_transactions VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name in CHECK_CONSTRAINTS:
+        op.drop_constraint(name, "credit_transactions", type_="check")
+
+    sa.Enum(*PROVIDERS, name="credittransactionprovider").create(op.get_bind())
+    sa.Enum(*STATUSES, name="credittransactionstatus").create(op.get_bind())
+    op.execute(
+        "ALTER TABLE credit_transactions "
+        "ALTER COLUMN provider TYPE credittransactionprovider USING provider::credittransactionprovider, "
+        "ALTER COLUMN status TYPE credittransactionstatus USING status::credittransactionstatus"
+    )
+
+    op.create_check_constraint(
+        "check_block_number_required", "credit_transactions", CHECK_CONSTRAINTS["check_block_number_required"]
+    )
+    op.create_check_constraint(
+        "check_provider_choices", "credit_transactions", f"provider::text IN ({', '.join(repr(p) for p in PROVIDERS)})"
+    )
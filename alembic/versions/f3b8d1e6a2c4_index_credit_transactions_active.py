@@ -0,0 +1,55 @@
+"""index active credit_transactions (user_id) and (expired_at)
+
+Revision ID: f3b8d1e6a2c4
+Revises: e7a1c2d9b3f4
+Create Date: 2026-10-16
+
+credit_transactions had no index besides its PK and the external_reference unique.
+Balance reads and credit deductions filter on user_id AND is_active, and the hourly
+expiry job on is_active AND expired_at < now(); both seq-scanned the table. Partial
+indexes only cover the active rows (the expiry one only those with an expiration), so
+they stay small as spent/expired history grows. Created CONCURRENTLY to avoid locking
+writes.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8d1e6a2c4"
+down_revision: str | None = "e7a1c2d9b3f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = {
+    "ix_credit_transactions_user_id_active": (["user_id"], "is_active"),
+    "ix_credit_transactions_expired_at_active": (["expired_at"], "is_active AND expired_at IS NOT NULL"),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (columns, where) in INDEXES.items():
+            op.create_index(
+                name,
+                "credit_transactions",
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name="credit_transactions",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
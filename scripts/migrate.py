@@ -4,12 +4,16 @@ App replicas run this at boot (see docker-entrypoint.sh); the lock serializes th
 concurrent starts don't race the same migration. Whoever runs second finds the schema
 already at head and no-ops. Blocking (not try-lock): every starter must wait for the
 schema to be at head before serving.
+
+The applied revisions are read once up front: when they already match the script heads
+(the common case for every boot but the first after a deploy), Alembic isn't invoked at all.
 """
 
 import os
 
 import psycopg
 from alembic.config import Config
+from alembic.script import ScriptDirectory
 from dotenv import load_dotenv
 
 from alembic import command
@@ -18,12 +22,21 @@ from src.utils.pg_locks import MIGRATIONS_LOCK_ID
 load_dotenv()
 
 
+def _is_at_head(conn: psycopg.Connection, alembic_config: Config) -> bool:
+    if conn.execute("SELECT to_regclass('alembic_version')").fetchone()[0] is None:
+        return False  # Fresh database
+    applied = {row[0] for row in conn.execute("SELECT version_num FROM alembic_version")}
+    return applied == set(ScriptDirectory.from_config(alembic_config).get_heads())
+
+
 def main() -> None:
     url = os.path.expandvars(os.environ["DATABASE_URL"])
+    alembic_config = Config("alembic.ini")
     with psycopg.connect(url) as conn:
         conn.execute("SELECT pg_advisory_lock(%s)", (MIGRATIONS_LOCK_ID,))
         try:
-            command.upgrade(Config("alembic.ini"), "head")
+            if not _is_at_head(conn, alembic_config):
+                command.upgrade(alembic_config, "head")
         finally:
             conn.execute("SELECT pg_advisory_unlock(%s)", (MIGRATIONS_LOCK_ID,))
 
@@ -6,6 +6,8 @@ from eth_typing import ChecksumAddress
 from solders.pubkey import Pubkey
 from web3 import Web3
 
+_dotenv_loaded = False
+
 
 class _Config:
     LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE: ChecksumAddress
@@ -87,66 +89,70 @@ class _Config:
     REVOLUT_PLAN_IDS: str
 
     def __init__(self):
-        load_dotenv()
+        global _dotenv_loaded
+        env = os.environ
+        # Parse .env only once per process
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
         self.LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE = Web3.to_checksum_address(
-            os.getenv("LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE")
+            env.get("LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE")
         )
         self.LTAI_PAYMENT_PROCESSOR_CONTRACT_SOLANA = Pubkey.from_string(
-            os.getenv("LTAI_PAYMENT_PROCESSOR_CONTRACT_SOLANA")
+            env.get("LTAI_PAYMENT_PROCESSOR_CONTRACT_SOLANA")
         )
-        self.BASE_RPC_URL = os.getenv("BASE_RPC_URL")
-        self.SOLANA_RPC_URL = os.getenv("SOLANA_RPC_URL")
+        self.BASE_RPC_URL = env.get("BASE_RPC_URL")
+        self.SOLANA_RPC_URL = env.get("SOLANA_RPC_URL")
 
-        self.DATABASE_URL = os.path.expandvars(os.getenv("DATABASE_URL", ""))
+        self.DATABASE_URL = os.path.expandvars(env.get("DATABASE_URL", ""))
 
-        self.THIRDWEB_WEBHOOK_SECRET = os.getenv("THIRDWEB_WEBHOOK_SECRET")
+        self.THIRDWEB_WEBHOOK_SECRET = env.get("THIRDWEB_WEBHOOK_SECRET")
 
         # Configure logging
-        log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
-        self.LOG_LEVEL = getattr(logging, log_level_str, logging.INFO)
-        self.LOG_FILE = os.getenv("LOG_FILE", None)
+        self.LOG_LEVEL = getattr(logging, env.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+        self.LOG_FILE = env.get("LOG_FILE", None)
 
-        self.JWT_SECRET = os.getenv("JWT_SECRET")
-        self.JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES"))
-        self.ALLOW_LOCALHOST_FRONTENDS = os.getenv("ALLOW_LOCALHOST_FRONTENDS", "False").lower() == "true"
+        self.JWT_SECRET = env.get("JWT_SECRET")
+        self.JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(env.get("JWT_ACCESS_TOKEN_EXPIRE_MINUTES"))
+        self.ALLOW_LOCALHOST_FRONTENDS = env.get("ALLOW_LOCALHOST_FRONTENDS", "False").lower() == "true"
 
-        self.ADMIN_SECRET = os.getenv("ADMIN_SECRET", "")
-        self.LIBERCLAW_SECRET: str = os.getenv("LIBERCLAW_SECRET", "")
+        self.ADMIN_SECRET = env.get("ADMIN_SECRET", "")
+        self.LIBERCLAW_SECRET: str = env.get("LIBERCLAW_SECRET", "")
 
-        self.ALEPH_API_URL = os.getenv("ALEPH_API_URL")
-        self.ALEPH_SENDER = os.getenv("ALEPH_SENDER")
-        self.ALEPH_OWNER = os.getenv("ALEPH_OWNER")
-        self.ALEPH_SENDER_SK = os.getenv("ALEPH_SENDER_SK")  # type: ignore
-        self.ALEPH_SENDER_PK = os.getenv("ALEPH_SENDER_PK")  # type: ignore
+        self.ALEPH_API_URL = env.get("ALEPH_API_URL")
+        self.ALEPH_SENDER = env.get("ALEPH_SENDER")
+        self.ALEPH_OWNER = env.get("ALEPH_OWNER")
+        self.ALEPH_SENDER_SK = env.get("ALEPH_SENDER_SK")  # type: ignore
+        self.ALEPH_SENDER_PK = env.get("ALEPH_SENDER_PK")  # type: ignore
 
-        self.ALEPH_AGENT_CHANNEL = os.getenv("ALEPH_AGENT_CHANNEL")
+        self.ALEPH_AGENT_CHANNEL = env.get("ALEPH_AGENT_CHANNEL")
 
-        self.LIBERTAI_CHAT_API_KEY = os.getenv("LIBERTAI_CHAT_API_KEY")
-        self.LIBERTAI_CHAT_API_BASE_URL = os.getenv("LIBERTAI_CHAT_API_BASE_URL")
-        self.THIRDWEB_SECRET_KEY = os.getenv("THIRDWEB_SECRET_KEY", "")
-        self.THIRDWEB_VAULT_ACCESS_TOKEN = os.getenv("THIRDWEB_VAULT_ACCESS_TOKEN", "")
+        self.LIBERTAI_CHAT_API_KEY = env.get("LIBERTAI_CHAT_API_KEY")
+        self.LIBERTAI_CHAT_API_BASE_URL = env.get("LIBERTAI_CHAT_API_BASE_URL")
+        self.THIRDWEB_SECRET_KEY = env.get("THIRDWEB_SECRET_KEY", "")
+        self.THIRDWEB_VAULT_ACCESS_TOKEN = env.get("THIRDWEB_VAULT_ACCESS_TOKEN", "")
 
         # OAuth
-        self.GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
-        self.GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
-        self.GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID", "")
-        self.GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET", "")
+        self.GOOGLE_CLIENT_ID = env.get("GOOGLE_CLIENT_ID", "")
+        self.GOOGLE_CLIENT_SECRET = env.get("GOOGLE_CLIENT_SECRET", "")
+        self.GITHUB_CLIENT_ID = env.get("GITHUB_CLIENT_ID", "")
+        self.GITHUB_CLIENT_SECRET = env.get("GITHUB_CLIENT_SECRET", "")
 
         # Magic-link / email
-        self.MAGIC_LINK_SECRET = os.getenv("MAGIC_LINK_SECRET", "")
-        self.SMTP_HOST = os.getenv("SMTP_HOST", "")
-        self.SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-        self.SMTP_USER = os.getenv("SMTP_USER", "")
-        self.SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
-        self.SMTP_FROM = os.getenv("SMTP_FROM", "LibertAI <noreply@libertai.io>")
-        self.SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "True").lower() == "true"
+        self.MAGIC_LINK_SECRET = env.get("MAGIC_LINK_SECRET", "")
+        self.SMTP_HOST = env.get("SMTP_HOST", "")
+        self.SMTP_PORT = int(env.get("SMTP_PORT", "587"))
+        self.SMTP_USER = env.get("SMTP_USER", "")
+        self.SMTP_PASSWORD = env.get("SMTP_PASSWORD", "")
+        self.SMTP_FROM = env.get("SMTP_FROM", "LibertAI <noreply@libertai.io>")
+        self.SMTP_USE_TLS = env.get("SMTP_USE_TLS", "True").lower() == "true"
 
         # Token encryption (Fernet)
-        self.ENCRYPTION_KEY = os.getenv("ENCRYPTION_KEY", "")
-        self.ENCRYPTION_KEY_PREVIOUS = os.getenv("ENCRYPTION_KEY_PREVIOUS", None)
+        self.ENCRYPTION_KEY = env.get("ENCRYPTION_KEY", "")
+        self.ENCRYPTION_KEY_PREVIOUS = env.get("ENCRYPTION_KEY_PREVIOUS", None)
 
         # URLs + token lifetimes
-        self.FRONTEND_URL = os.getenv("FRONTEND_URL", "")
+        self.FRONTEND_URL = env.get("FRONTEND_URL", "")
         # Origins we're willing to send a logged-in user to. Used both for CORS and to
         # validate the magic-link redirect target so the sign-in email points back to the
         # app the request came from (chat vs console), never an attacker-supplied URL.
@@ -156,23 +162,23 @@ class _Config:
             "https://beta.chat.libertai.io",
             "https://chat.libertai.io",
         ] + (["http://localhost:5173", "http://localhost:3000"] if self.ALLOW_LOCALHOST_FRONTENDS else [])
-        self.API_URL = os.getenv("API_URL", "")
-        self.JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "90"))
+        self.API_URL = env.get("API_URL", "")
+        self.JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(env.get("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "90"))
 
         # Warm API-key pool
-        self.POOL_SIZE = int(os.getenv("POOL_SIZE", "5"))
-        self.POOL_WARM_THRESHOLD_SECONDS = int(os.getenv("POOL_WARM_THRESHOLD_SECONDS", "60"))
-        self.POOL_RECONCILE_INTERVAL_SECONDS = int(os.getenv("POOL_RECONCILE_INTERVAL_SECONDS", "300"))
+        self.POOL_SIZE = int(env.get("POOL_SIZE", "5"))
+        self.POOL_WARM_THRESHOLD_SECONDS = int(env.get("POOL_WARM_THRESHOLD_SECONDS", "60"))
+        self.POOL_RECONCILE_INTERVAL_SECONDS = int(env.get("POOL_RECONCILE_INTERVAL_SECONDS", "300"))
 
         # GeoIP database
-        self.GEOIP_DB_PATH = os.getenv("GEOIP_DB_PATH", "/data/GeoLite2-Country.mmdb")
+        self.GEOIP_DB_PATH = env.get("GEOIP_DB_PATH", "/data/GeoLite2-Country.mmdb")
 
         # Payments (Revolut)
-        self.REVOLUT_SECRET_KEY = os.getenv("REVOLUT_SECRET_KEY", "")
-        self.REVOLUT_WEBHOOK_SECRET = os.getenv("REVOLUT_WEBHOOK_SECRET", "")
-        self.REVOLUT_API_URL = os.getenv("REVOLUT_API_URL", "https://merchant.revolut.com")
-        self.REVOLUT_API_VERSION = os.getenv("REVOLUT_API_VERSION", "2026-04-20")
-        self.REVOLUT_PLAN_IDS = os.getenv("REVOLUT_PLAN_IDS", "")
+        self.REVOLUT_SECRET_KEY = env.get("REVOLUT_SECRET_KEY", "")
+        self.REVOLUT_WEBHOOK_SECRET = env.get("REVOLUT_WEBHOOK_SECRET", "")
+        self.REVOLUT_API_URL = env.get("REVOLUT_API_URL", "https://merchant.revolut.com")
+        self.REVOLUT_API_VERSION = env.get("REVOLUT_API_VERSION", "2026-04-20")
+        self.REVOLUT_PLAN_IDS = env.get("REVOLUT_PLAN_IDS", "")
 
 
 config = _Config()
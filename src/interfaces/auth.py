@@ -1,9 +1,10 @@
 import math
 
-from libertai_utils.chains.index import is_address_valid
 from libertai_utils.interfaces.blockchain import LibertaiChain
 from pydantic import BaseModel, ValidationInfo, field_validator
 
+from src.utils.address import is_address_valid
+
 
 class AuthMessageRequest(BaseModel):
     chain: LibertaiChain
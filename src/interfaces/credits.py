@@ -3,10 +3,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Annotated, Literal
 
-from libertai_utils.chains.index import is_address_valid
 from libertai_utils.interfaces.blockchain import LibertaiChain
 from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
+from src.utils.address import is_address_valid
+
 
 class CreditTransactionProvider(str, Enum):
     ltai_base = "ltai_base"  # LTAI Base payments
@@ -45,6 +46,15 @@ class CreditTransactionsResponse(BaseModel):
     transactions: list[CreditTransactionResponse]
 
 
+class WalletCreditPayment(BaseModel):
+    """An on-chain payment to credit to the wallet that sent it."""
+
+    address: str
+    amount: float  # USD value, before the provider boost
+    external_reference: str
+    block_number: int | None = None
+
+
 class ExpiredCreditTransaction(BaseModel):
     id: str  # UUID as string
     external_reference: str | None
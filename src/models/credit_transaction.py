@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import TIMESTAMP, UUID, Boolean, CheckConstraint, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import TIMESTAMP, UUID, Boolean, CheckConstraint, Enum, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -39,7 +39,10 @@ class CreditTransaction(Base):
     amount_left: Mapped[float] = mapped_column(
         Float, nullable=False
     )  # Remaining amount available from this transaction
-    provider: Mapped[CreditTransactionProvider] = mapped_column(Enum(CreditTransactionProvider), nullable=False)
+    # Non-native enums (VARCHAR + check constraint): adding a member doesn't rewrite the table
+    provider: Mapped[CreditTransactionProvider] = mapped_column(
+        Enum(CreditTransactionProvider, native_enum=False, length=32), nullable=False
+    )
     block_number: Mapped[int | None] = mapped_column(
         Integer, nullable=True
     )  # The block number this transaction was processed in
@@ -49,7 +52,9 @@ class CreditTransaction(Base):
         Boolean, nullable=False, default=True
     )  # Whether the credits of this transaction are still active
     status: Mapped[CreditTransactionStatus] = mapped_column(
-        Enum(CreditTransactionStatus), nullable=False, default=CreditTransactionStatus.completed
+        Enum(CreditTransactionStatus, native_enum=False, length=32),
+        nullable=False,
+        default=CreditTransactionStatus.completed,
     )  # Status of the transaction
 
     def __init__(
@@ -85,6 +90,25 @@ class CreditTransaction(Base):
             "(provider::text = 'thirdweb' OR provider::text = 'voucher' OR provider::text = 'revolut') OR (provider::text = 'ltai_base' AND block_number IS NOT NULL) OR (provider::text = 'ltai_solana' AND block_number IS NOT NULL) OR (provider::text = 'sol_solana' AND block_number IS NOT NULL)",
             name="check_block_number_required",
         ),
+        CheckConstraint(
+            "provider IN ('ltai_base', 'ltai_solana', 'thirdweb', 'voucher', 'sol_solana', 'revolut')",
+            name="check_provider_choices",
+        ),
+        CheckConstraint("status IN ('pending', 'completed', 'error')", name="check_status_choices"),
+        # Balance / deduction lookups and the hourly expiry job only ever read active rows
+        Index("ix_credit_transactions_user_id_active", "user_id", postgresql_where=text("is_active")),
+        Index(
+            "ix_credit_transactions_expired_at_active",
+            "expired_at",
+            postgresql_where=text("is_active AND expired_at IS NOT NULL"),
+        ),
+        # Payment pollers resume from the highest block_number seen for their provider(s)
+        Index(
+            "ix_credit_transactions_provider_block_number",
+            "provider",
+            "block_number",
+            postgresql_where=text("block_number IS NOT NULL"),
+        ),
     )
 
     user: Mapped["User"] = relationship("User", back_populates="credit_transactions")
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import (
     TIMESTAMP,
     UUID,
+    BigInteger,
     CheckConstraint,
     Float,
     ForeignKey,
@@ -24,7 +25,7 @@ if TYPE_CHECKING:
 class InferenceCall(Base):
     __tablename__ = "inference_calls"
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     api_key_id: Mapped[uuid.UUID] = mapped_column(UUID, ForeignKey("api_keys.id", ondelete="CASCADE"), nullable=False)
     credits_used: Mapped[float] = mapped_column(Float, nullable=False)
     # Portion of credits_used covered by the tier's entitlement windows; the rest was
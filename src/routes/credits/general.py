@@ -1,11 +1,11 @@
 from datetime import datetime
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import String, cast, select, update
 
 from src.interfaces.credits import (
     CreditBalanceResponse,
-    CreditTransactionProvider,
     CreditTransactionResponse,
     CreditTransactionsResponse,
     ExpiredCreditTransaction,
@@ -22,37 +22,45 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_TRANSACTION_LIST_ADAPTER = TypeAdapter(list[CreditTransactionResponse])
 
-@scheduler.scheduled_job("interval", hours=1)
+
+# A run delayed past its slot (busy loop, slow previous run) still happens, and backed-up runs collapse into one
+@scheduler.scheduled_job("interval", hours=1, coalesce=True, misfire_grace_time=None)
 @router.post("/update-expired", description="Deactivate credits with a past expiration date.")  # type: ignore
 async def update_expired_credit_transactions() -> ExpiredCreditTransactionsResponse:
     try:
         async with AsyncSessionLocal() as db:
+            # One UPDATE ... RETURNING deactivates every expired row and hands back what the response needs
             result = await db.execute(
-                select(CreditTransaction).where(
+                update(CreditTransaction)
+                .where(
                     CreditTransaction.is_active == True,
                     CreditTransaction.expired_at.isnot(None),
                     CreditTransaction.expired_at < datetime.now(),
                 )
+                .values(is_active=False)
+                .returning(
+                    CreditTransaction.id,
+                    CreditTransaction.external_reference,
+                    CreditTransaction.address,
+                    CreditTransaction.expired_at,
+                )
             )
-            expired_transactions = result.scalars().all()
-
-            if not expired_transactions:
-                return ExpiredCreditTransactionsResponse(updated_count=0, transactions=[])
+            expired_transactions = result.all()
+            await db.commit()
 
-            transactions_response = []
-            for tx in expired_transactions:
-                tx.is_active = False
-                transactions_response.append(
-                    ExpiredCreditTransaction(
-                        id=str(tx.id),
-                        external_reference=tx.external_reference,
-                        address=tx.address,
-                        expired_at=tx.expired_at,
-                    )
+            # Rows straight from our own RETURNING clause: skip per-row validation
+            transactions_response = [
+                ExpiredCreditTransaction.model_construct(
+                    id=str(tx.id),
+                    external_reference=tx.external_reference,
+                    address=tx.address,
+                    expired_at=tx.expired_at,
                 )
-            await db.commit()
-            return ExpiredCreditTransactionsResponse(
+                for tx in expired_transactions
+            ]
+            return ExpiredCreditTransactionsResponse.model_construct(
                 updated_count=len(expired_transactions), transactions=transactions_response
             )
 
@@ -80,29 +88,24 @@ async def get_transaction_history(user: User = Depends(get_current_user)) -> Cre
     try:
         async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(CreditTransaction)
+                select(
+                    cast(CreditTransaction.id, String).label("id"),
+                    CreditTransaction.external_reference,
+                    CreditTransaction.amount,
+                    CreditTransaction.amount_left,
+                    CreditTransaction.provider,
+                    CreditTransaction.created_at,
+                    CreditTransaction.expired_at,
+                    CreditTransaction.is_active,
+                    CreditTransaction.status,
+                )
                 .where(CreditTransaction.user_id == user.id)
                 .order_by(CreditTransaction.created_at.desc())
             )
-            transactions = result.scalars().all()
-
-            transaction_responses = []
-            for tx in transactions:
-                transaction_responses.append(
-                    CreditTransactionResponse(
-                        id=str(tx.id),
-                        external_reference=tx.external_reference,
-                        amount=tx.amount,
-                        amount_left=tx.amount_left,
-                        provider=CreditTransactionProvider(tx.provider),
-                        created_at=tx.created_at,
-                        expired_at=tx.expired_at,
-                        is_active=tx.is_active,
-                        status=tx.status,
-                    )
-                )
+            # Plain rows validated in one pass: no ORM entities are built for a read-only listing
+            transactions = _TRANSACTION_LIST_ADAPTER.validate_python(result.all(), from_attributes=True)
 
-            return CreditTransactionsResponse(address=user.address, transactions=transaction_responses)
+            return CreditTransactionsResponse.model_construct(address=user.address, transactions=transactions)
     except Exception as e:
         logger.error(f"Error retrieving transaction history for user {user.id}: {e!s}", exc_info=True)
         raise HTTPException(
@@ -1,21 +1,21 @@
-import asyncio
 import json
 import os
 
+import aiohttp
 from fastapi import HTTPException
 from libertai_utils.chains.index import format_address
 from libertai_utils.interfaces.blockchain import LibertaiChain
 from sqlalchemy import select
-from web3 import Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3
 
 from src.config import config
-from src.interfaces.credits import CreditTransactionProvider
+from src.interfaces.credits import CreditTransactionProvider, WalletCreditPayment
 from src.models.base import AsyncSessionLocal
 from src.models.credit_transaction import CreditTransaction
 from src.routes.credits import router
 from src.services.credit import CreditService
 from src.services.solana import SolanaService
-from src.utils.cron import ltai_base_payments_lock, ltai_solana_payments_lock, scheduler
+from src.utils.cron import scheduler
 from src.utils.logger import setup_logger
 from src.utils.pg_locks import LTAI_BASE_LOCK_ID, LTAI_SOLANA_LOCK_ID, single_runner
 from src.utils.token import get_token_price
@@ -23,53 +23,96 @@ from src.utils.token import get_token_price
 logger = setup_logger(__name__)
 solana_service = SolanaService()
 
-w3 = Web3(Web3.HTTPProvider(config.BASE_RPC_URL))
+# Async provider: RPC calls are awaited on the event loop instead of tying up a worker thread each.
+# web3 caches one aiohttp session per endpoint, so every poll reuses the same keep-alive connections.
+w3 = AsyncWeb3(AsyncHTTPProvider(config.BASE_RPC_URL, request_kwargs={"timeout": aiohttp.ClientTimeout(total=10)}))
+
+LTAI_DECIMALS_FACTOR = 10**18
 
 
 code_dir = os.path.dirname(os.path.abspath(__file__))
 with open(os.path.join(code_dir, "../../abis/LTAIPaymentProcessor.json"), "r") as abi_file:
     PAYMENT_PROCESSOR_CONTRACT_ABI = json.load(abi_file)
 
-
-@scheduler.scheduled_job("interval", seconds=60)
+# Built once and reused by every polling run
+payment_processor_contract = w3.eth.contract(
+    address=config.LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE, abi=PAYMENT_PROCESSOR_CONTRACT_ABI
+)
+
+# Last Base block this process fully scanned: later runs only fetch the blocks after it rather than
+# the whole safety margin again. Per process, so another replica's run can only cause overlap
+# (deduplicated by external_reference), never a gap.
+_last_scanned_block: int | None = None
+# Blocks before the cursor that are scanned again on each run, in case a load-balanced RPC node
+# lagging behind the tip returned incomplete logs for them
+RESCAN_MARGIN_BLOCKS = 10
+# Lowest block holding a payment that failed in the last run: the next run starts no later than it,
+# even if payments in later blocks were recorded and moved the DB high-water mark past it
+_retry_from_block: int | None = None
+
+
+# Overlapping runs (scheduler tick vs. manual trigger, or another replica) are skipped by single_runner's
+# advisory lock; late ticks collapse into one run instead of queuing up.
+@scheduler.scheduled_job("interval", seconds=60, max_instances=1, coalesce=True)
 @router.post("/ltai/base/process", description="Process credit purchase with $LTAI transactions in Base")  # type: ignore
 @single_runner(LTAI_BASE_LOCK_ID, skip_result=[])
 async def process_base_ltai_transactions() -> list[str]:
+    global _last_scanned_block, _retry_from_block
     try:
-        async with AsyncSessionLocal() as db:
-            processed_transactions: list[str] = []
+        processed_transactions: list[str] = []
 
-            if ltai_base_payments_lock.locked():
-                return processed_transactions  # Skip execution if already running
+        latest_block = await w3.eth.block_number
+        if _last_scanned_block is not None and latest_block <= _last_scanned_block:
+            return processed_transactions  # No new block since the last run
 
-            result = await db.execute(
-                select(CreditTransaction)
-                .where(CreditTransaction.provider == CreditTransactionProvider.ltai_base)
-                .order_by(CreditTransaction.block_number.desc())
-                .limit(1)
-            )
-            last_db_block = result.scalars().first()
+        # Only the integer is needed, and the connection goes back to the pool before fetching the logs
+        async with AsyncSessionLocal() as db:
             last_block_number = (
-                last_db_block.block_number if last_db_block and last_db_block.block_number is not None else 0
-            )
-
-            async with ltai_base_payments_lock:
-                contract = w3.eth.contract(
-                    address=config.LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE, abi=PAYMENT_PROCESSOR_CONTRACT_ABI
+                await db.execute(
+                    select(CreditTransaction.block_number)
+                    .where(
+                        CreditTransaction.provider == CreditTransactionProvider.ltai_base,
+                        CreditTransaction.block_number.isnot(None),
+                    )
+                    .order_by(CreditTransaction.block_number.desc())
+                    .limit(1)
                 )
-
-                # Start from recent blocks with a margin to include missed blocks between executions or downtimes
-                from_block = await asyncio.to_thread(lambda: w3.eth.block_number) - 1000
-                start_block = max(from_block, last_block_number + 1)
-
-                events = await asyncio.to_thread(contract.events.PaymentProcessed.get_logs, from_block=start_block)
-
+            ).scalar() or 0
+
+        # Start from recent blocks with a margin to include missed blocks between executions or downtimes
+        start_block = max(latest_block - 1000, last_block_number + 1)
+        if _last_scanned_block is not None:
+            start_block = max(start_block, _last_scanned_block + 1 - RESCAN_MARGIN_BLOCKS)
+        if _retry_from_block is not None:
+            # Still within the usual 1000 blocks window, so a payment that keeps failing is eventually dropped
+            start_block = min(start_block, max(_retry_from_block, latest_block - 1000))
+        if start_block > latest_block:
+            return processed_transactions  # This node is behind the blocks another run already recorded
+
+        events = await payment_processor_contract.events.PaymentProcessed.get_logs(
+            from_block=start_block, to_block=latest_block
+        )
+
+        failed_blocks: list[int] = []
+        if events:
+            token_price = await get_token_price()  # One quote for the whole run
+            payments = []
             for event in events:
                 try:
-                    external_reference = await handle_payment_event(event)
-                    processed_transactions.append(external_reference)
+                    payments.append(payment_from_event(event, token_price))
                 except Exception as e:
+                    failed_blocks.append(event["blockNumber"])
                     logger.error(f"Error processing payment: {e}", exc_info=True)
+            processed_transactions, failed = await CreditService.add_wallet_credits_batch(
+                CreditTransactionProvider.ltai_base, payments
+            )
+            for payment in payments:
+                if payment.external_reference in failed and payment.block_number is not None:
+                    failed_blocks.append(payment.block_number)
+
+        _last_scanned_block = latest_block
+        # A failed payment keeps its block in the next run's range so it gets retried
+        _retry_from_block = min(failed_blocks, default=None)
 
         return processed_transactions
     except Exception as e:
@@ -77,35 +120,21 @@ async def process_base_ltai_transactions() -> list[str]:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@scheduler.scheduled_job("interval", seconds=100)
+@scheduler.scheduled_job("interval", seconds=100, max_instances=1, coalesce=True)
 @router.post("/ltai/solana/process", description="Process credit purchase with $LTAI in solana blockchain")  # type: ignore
 @single_runner(LTAI_SOLANA_LOCK_ID, skip_result=[])
 async def process_solana_ltai_transactions() -> list[str]:
-    processed_transactions: list[str] = []
-
-    if ltai_solana_payments_lock.locked():
-        return processed_transactions
-
-    async with ltai_solana_payments_lock:
-        processed_transactions = await solana_service.poll_transactions()
-        return processed_transactions
-
+    return await solana_service.poll_transactions()
 
-async def handle_payment_event(event) -> str:
-    logger.debug(f"Processing payment event: {event}")
 
-    external_reference = f"0x{event['transactionHash'].hex()}"
-    sender = event["args"]["sender"]
-    ltai_amount = event["args"]["amount"] / 10**18
-    block_number = event["blockNumber"]
+def payment_from_event(event, token_price: float) -> WalletCreditPayment:
+    # Lazy %-formatting: the event repr is only rendered when debug logging is enabled
+    logger.debug("Processing payment event: %s", event)
 
-    token_price = await get_token_price()  # Get token/USD price
-    amount = token_price * ltai_amount  # Calculate USD value
-    await CreditService.add_credits(
-        CreditTransactionProvider.ltai_base,
-        format_address(LibertaiChain.base, sender),
-        amount,
-        external_reference,
-        block_number,
+    ltai_amount = event["args"]["amount"] / LTAI_DECIMALS_FACTOR
+    return WalletCreditPayment(
+        address=format_address(LibertaiChain.base, event["args"]["sender"]),
+        amount=token_price * ltai_amount,  # Calculate USD value
+        external_reference=event["transactionHash"].to_0x_hex(),
+        block_number=event["blockNumber"],
     )
-    return external_reference
@@ -6,7 +6,6 @@ import uuid
 from fastapi import Header, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy import select
-from web3 import Web3
 
 from src.config import config
 from src.interfaces.credits import (
@@ -27,6 +26,10 @@ logger = setup_logger(__name__)
 # Maximum age of webhook in seconds before rejecting it (5 minutes)
 MAX_WEBHOOK_AGE = 300
 
+# Lowercased once: receivers are compared case-insensitively instead of checksumming
+# (keccak-hashing) each webhook's receiver address
+PAYMENT_PROCESSOR_BASE_ADDRESS = config.LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE.lower()
+
 
 class ThirdwebWebhookPayload(BaseModel):
     version: int
@@ -86,21 +89,21 @@ async def thirdweb_webhook(
         logger.warning(f"Invalid timestamp format: {timestamp}")
         raise HTTPException(status_code=401, detail="Invalid timestamp format")
 
-    # Get raw request body for signature verification
+    # Get raw request body for signature verification (already buffered by the payload parsing).
+    # Signed as bytes: no decode/re-encode round-trip of the whole body.
     body = await request.body()
-    body_str = body.decode("utf-8")
-
-    signature_payload = f"{timestamp}.{body_str}"
+    signature_payload = timestamp.encode() + b"." + body
 
     expected_signature = hmac.new(
-        config.THIRDWEB_WEBHOOK_SECRET.encode(), signature_payload.encode(), hashlib.sha256
+        config.THIRDWEB_WEBHOOK_SECRET.encode(), signature_payload, hashlib.sha256
     ).hexdigest()
 
     if not hmac.compare_digest(expected_signature, signature):
         logger.warning("Invalid webhook signature")
         raise HTTPException(status_code=401, detail="Invalid signature")
 
-    logger.debug(f"Received Thirdweb webhook: {payload.model_dump_json()}")
+    # Lazy %-formatting: the payload is only stringified when debug logging is enabled
+    logger.debug("Received Thirdweb webhook: %s", payload)
 
     if payload.is_onchain_transaction:
         await _handle_onchain_transaction(payload.onchain_data)
@@ -128,7 +131,7 @@ async def _handle_onchain_transaction(data: ThirdwebOnchainTransactionData | Non
     if data is None:
         raise HTTPException(status_code=400, detail="Missing onchain transaction data")
 
-    if Web3.to_checksum_address(data.receiver) != config.LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE:
+    if data.receiver.lower() != PAYMENT_PROCESSOR_BASE_ADDRESS:
         logger.warning(f"Transaction not destined for LTAI payment processor ({data.receiver}), ignoring it")
         return
 
@@ -174,7 +177,7 @@ async def _handle_onramp_transaction(data: ThirdwebOnrampTransactionData | None)
     if data is None:
         raise HTTPException(status_code=400, detail="Missing onramp transaction data")
 
-    if Web3.to_checksum_address(data.receiver) != config.LTAI_PAYMENT_PROCESSOR_CONTRACT_BASE:
+    if data.receiver.lower() != PAYMENT_PROCESSOR_BASE_ADDRESS:
         logger.warning(f"Onramp transaction not destined for LTAI payment processor ({data.receiver}), ignoring it")
         return
 
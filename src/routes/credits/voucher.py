@@ -76,9 +76,9 @@ async def get_vouchers(
     else:
         raise HTTPException(status_code=400, detail="Provide an email, or a wallet address with its chain")
 
-    # Convert to response model
+    # Convert to response model; the rows come from our own DB, so skip per-row validation
     return [
-        VoucherCreditsResponse(
+        VoucherCreditsResponse.model_construct(
             id=str(voucher.id),
             address=voucher.address,
             amount=voucher.amount,
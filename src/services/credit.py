@@ -2,9 +2,10 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.interfaces.credits import CreditTransactionProvider, CreditTransactionStatus
+from src.interfaces.credits import CreditTransactionProvider, CreditTransactionStatus, WalletCreditPayment
 from src.models.base import AsyncSessionLocal
 from src.models.credit_transaction import CreditTransaction
 from src.services.users import get_or_create_user_by_wallet
@@ -13,6 +14,15 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+def _apply_provider_boost(provider: CreditTransactionProvider, amount: float) -> float:
+    """Apply the boost for LTAI payments"""
+    return (
+        amount * 100 / 80
+        if provider in [CreditTransactionProvider.ltai_base, CreditTransactionProvider.ltai_solana]
+        else amount
+    )
+
+
 class CreditService:
     @staticmethod
     async def add_credits(
@@ -24,12 +34,7 @@ class CreditService:
         expired_at: datetime | None = None,
         status: CreditTransactionStatus = CreditTransactionStatus.completed,
     ) -> bool:
-        # Apply the boost for LTAI payments
-        amount = (
-            amount * 100 / 80
-            if provider in [CreditTransactionProvider.ltai_base, CreditTransactionProvider.ltai_solana]
-            else amount
-        )
+        amount = _apply_provider_boost(provider, amount)
 
         log_msg = f"Adding {amount} credits to address {address} with status {status.value}"
         if external_reference:
@@ -73,6 +78,93 @@ class CreditService:
             logger.error(f"Error adding credits to {address}: {e!s}", exc_info=True)
             raise
 
+    @staticmethod
+    async def add_wallet_credits_batch(
+        provider: CreditTransactionProvider, payments: list[WalletCreditPayment]
+    ) -> tuple[list[str], list[str]]:
+        """Credit several on-chain payments in one transaction and one INSERT.
+
+        Same semantics as calling ``add_credits`` for each payment (wallet resolution,
+        provider boost, ``external_reference`` idempotency), but the rows are written with a
+        single ``INSERT ... ON CONFLICT DO NOTHING`` and committed once. A payment whose wallet
+        can't be resolved is left out, and if the batch INSERT fails the payments are credited
+        one by one, so a bad payment doesn't hold back the others.
+        Returns the references actually recorded and those of the payments that failed;
+        already-processed ones are skipped.
+        """
+        if not payments:
+            return [], []
+
+        recorded: list[str] = []
+        failed: list[str] = []
+        fallback: list[WalletCreditPayment] = []
+        async with AsyncSessionLocal() as db:
+            user_ids: dict[str, uuid.UUID] = {}
+            unresolved: set[str] = set()
+            batched: list[WalletCreditPayment] = []
+            rows = []
+            for payment in payments:
+                if payment.address not in user_ids and payment.address not in unresolved:
+                    try:
+                        async with db.begin_nested():
+                            user_ids[payment.address] = (await get_or_create_user_by_wallet(db, payment.address)).id
+                    except Exception as e:
+                        unresolved.add(payment.address)
+                        logger.error(f"Error resolving user for wallet {payment.address}: {e!s}", exc_info=True)
+                if payment.address in unresolved:
+                    failed.append(payment.external_reference)
+                    continue
+                amount = _apply_provider_boost(provider, payment.amount)
+                batched.append(payment)
+                rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "user_id": user_ids[payment.address],
+                        "address": payment.address,
+                        "external_reference": payment.external_reference,
+                        "amount": amount,
+                        "amount_left": amount,
+                        "provider": provider,
+                        "block_number": payment.block_number,
+                        "is_active": True,
+                        "status": CreditTransactionStatus.completed,
+                    }
+                )
+
+            if rows:
+                try:
+                    result = await db.execute(
+                        pg_insert(CreditTransaction)
+                        .values(rows)
+                        .on_conflict_do_nothing(index_elements=["external_reference"])
+                        .returning(CreditTransaction.external_reference)
+                    )
+                    recorded = list(result.scalars().all())
+                    await db.commit()
+                except Exception as e:
+                    logger.error(
+                        f"Error adding {provider.value} credits for {len(rows)} payments, retrying one by one: {e!s}",
+                        exc_info=True,
+                    )
+                    await db.rollback()
+                    recorded = []
+                    fallback = batched
+
+        for payment in fallback:
+            try:
+                # add_credits applies the provider boost itself
+                if await CreditService.add_credits(
+                    provider, payment.address, payment.amount, payment.external_reference, payment.block_number
+                ):
+                    recorded.append(payment.external_reference)
+            except Exception:
+                failed.append(payment.external_reference)  # Already logged by add_credits
+
+        skipped = len(payments) - len(recorded) - len(failed)
+        if skipped:
+            logger.warning(f"{skipped} {provider.value} payment(s) already processed, skipped")
+        return recorded, failed
+
     @staticmethod
     async def add_credits_for_user(
         user_id: uuid.UUID,
@@ -35,7 +35,8 @@ class SolanaService:
                 .where(
                     CreditTransaction.provider.in_(
                         [CreditTransactionProvider.ltai_solana.value, CreditTransactionProvider.sol_solana.value]
-                    )
+                    ),
+                    CreditTransaction.block_number.isnot(None),
                 )
                 .order_by(desc(CreditTransaction.block_number))
                 .limit(1)
@@ -90,7 +91,7 @@ class SolanaService:
                         return {"user": user, "amount": amount, "status": status, "event_type": "sol_payment"}
 
                 except Exception as e:
-                    print(f"Error parsing event data: {e}")
+                    logger.warning(f"Error parsing event data: {e}")
                     continue
 
         return None
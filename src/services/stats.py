@@ -228,7 +228,7 @@ class StatsService:
                 while current_date <= end_date:
                     day_str = current_date.strftime("%Y-%m-%d")
                     d = daily_data.get(day_str, {"input_tokens": 0, "output_tokens": 0})
-                    daily_usage[day_str] = DailyTokens(
+                    daily_usage[day_str] = DailyTokens.model_construct(
                         input_tokens=d["input_tokens"], output_tokens=d["output_tokens"]
                     )
                     current_date += timedelta(days=1)
@@ -254,7 +254,7 @@ class StatsService:
                     total_calls += m.calls or 0
                     total_cost += float(m.cost or 0)
                     usage_by_model.append(
-                        UsageByEntity(
+                        UsageByEntity.model_construct(
                             name=m.name,
                             calls=m.calls or 0,
                             total_tokens=m.total_tokens or 0,
@@ -277,7 +277,7 @@ class StatsService:
                 ).all()
 
                 usage_by_api_key = [
-                    UsageByEntity(
+                    UsageByEntity.model_construct(
                         name=api_key_lookup.get(str(k.key_id), "Unknown"),
                         calls=k.calls or 0,
                         total_tokens=k.total_tokens or 0,
@@ -336,7 +336,7 @@ class StatsService:
                 c = float(stat.credits or 0)
                 total += c
                 credits_usage.append(
-                    CreditsUsage(
+                    CreditsUsage.model_construct(
                         credits_used=c,
                         used_at=stat.date.strftime("%Y-%m-%d"),
                         model_name=stat.model_name,
@@ -375,7 +375,7 @@ class StatsService:
                 count: int = stat[2]  # func.count result
                 total += count
                 api_usage.append(
-                    ModelApiUsage(
+                    ModelApiUsage.model_construct(
                         model_name=stat[1],
                         used_at=stat[0].strftime("%Y-%m-%d"),
                         call_count=count,
@@ -422,7 +422,7 @@ class StatsService:
                 total_output += out
                 total_cached += cached
                 calls.append(
-                    Call(
+                    Call.model_construct(
                         date=stat.date.strftime("%Y-%m-%d"),
                         nb_input_tokens=inp,
                         nb_output_tokens=out,
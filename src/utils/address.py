@@ -0,0 +1,13 @@
+"""Wallet address validation shared by the request models (auth, vouchers)."""
+
+from functools import lru_cache
+
+from libertai_utils.chains.index import is_address_valid as _is_address_valid
+from libertai_utils.interfaces.blockchain import LibertaiChain
+
+
+@lru_cache(maxsize=8192)
+def is_address_valid(chain: LibertaiChain | None, address: str) -> bool:
+    """``libertai_utils`` address check, cached: it is pure in (chain, address), and a wallet
+    signing in is validated on both the message and the login request."""
+    return _is_address_valid(chain, address)
@@ -1,4 +1,3 @@
-import asyncio
 from contextlib import asynccontextmanager
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -6,13 +5,11 @@ from fastapi import FastAPI
 
 scheduler = AsyncIOScheduler()
 
-ltai_base_payments_lock = asyncio.Lock()
-ltai_solana_payments_lock = asyncio.Lock()
-
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     from src.config import config
+    from src.routes.credits.ltai import w3 as base_w3
     from src.services.aleph import aleph_service
     from src.services.api_key_pool import ApiKeyPoolService
     from src.utils.token import close_async_client
@@ -30,3 +27,4 @@ async def lifespan(_app: FastAPI):
     yield
     scheduler.shutdown()
     await close_async_client()
+    await base_w3.provider.disconnect()
@@ -1,3 +1,5 @@
+import time
+
 import httpx
 
 from src.utils.logger import setup_logger
@@ -6,7 +8,11 @@ logger = setup_logger(__name__)
 
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3/simple/price"
 
+# Prices move on the minute scale: a poll run handling many payment events shares one quote
+PRICE_CACHE_TTL_SECONDS = 30
+
 _async_client = None
+_price_cache: dict[str, tuple[float, float]] = {}  # Coingecko id -> (monotonic fetch time, USD price)
 
 
 async def _get_async_client() -> httpx.AsyncClient:
@@ -30,49 +36,40 @@ async def close_async_client():
         _async_client = None
 
 
-async def get_token_price() -> float:
-    """Get the current price of $LTAI in USD from Coingecko"""
+async def _get_usd_price(coingecko_id: str) -> float:
+    """Get the USD price of a Coingecko asset, reusing a recent quote when there is one."""
+    cached = _price_cache.get(coingecko_id)
+    if cached is not None and time.monotonic() - cached[0] < PRICE_CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
         client = await _get_async_client()
-        response = await client.get(f"{COINGECKO_BASE_URL}?ids=libertai&vs_currencies=usd")
+        response = await client.get(f"{COINGECKO_BASE_URL}?ids={coingecko_id}&vs_currencies=usd")
         response.raise_for_status()
         price_data = response.json()
 
-        if "libertai" not in price_data or "usd" not in price_data["libertai"]:
+        if coingecko_id not in price_data or "usd" not in price_data[coingecko_id]:
             logger.error(f"Unexpected response format from Coingecko: {price_data}")
             raise ValueError("Unexpected response format from Coingecko")
 
-        price = price_data["libertai"]["usd"]
+        price = price_data[coingecko_id]["usd"]
 
         if price is None or price <= 0:
             logger.error(f"Invalid token price received: {price}")
             raise ValueError("Invalid price from Coingecko")
 
+        _price_cache[coingecko_id] = (time.monotonic(), price)
         return price
     except httpx.HTTPError as e:
         logger.error(f"Failed to fetch token price: {e!s}")
         raise
 
 
-async def get_sol_token_price() -> float:
-    """Get the current price of $SOL in USD from Coingecko"""
-    try:
-        client = await _get_async_client()
-        response = await client.get(f"{COINGECKO_BASE_URL}?ids=solana&vs_currencies=usd")
-        response.raise_for_status()
-        price_data = response.json()
-
-        if "solana" not in price_data or "usd" not in price_data["solana"]:
-            logger.error(f"Unexpected response format from Coingecko: {price_data}")
-            raise ValueError("Unexpected response format from Coingecko")
-
-        price = price_data["solana"]["usd"]
+async def get_token_price() -> float:
+    """Get the current price of $LTAI in USD from Coingecko"""
+    return await _get_usd_price("libertai")
 
-        if price is None or price <= 0:
-            logger.error(f"Invalid token price received: {price}")
-            raise ValueError("Invalid price from Coingecko")
 
-        return price
-    except httpx.HTTPError as e:
-        logger.error(f"Failed to fetch token price: {e!s}")
-        raise
+async def get_sol_token_price() -> float:
+    """Get the current price of $SOL in USD from Coingecko"""
+    return await _get_usd_price("solana")
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from sqlalchemy import select
 
-from src.interfaces.credits import CreditTransactionProvider
+from src.interfaces.credits import CreditTransactionProvider, WalletCreditPayment
 from src.models.api_key import ApiKey as ApiKeyDB
 from src.models.base import AsyncSessionLocal
 from src.models.credit_transaction import CreditTransaction
@@ -63,6 +63,44 @@ async def test_add_credits_for_user_adds_to_same_balance():
     assert await user.get_credit_balance() == 15.0
 
 
+async def test_add_wallet_credits_batch_records_once_per_reference():
+    address = "0xBa7c000000000000000000000000000000000005"
+    other = "0xBa7c000000000000000000000000000000000006"
+    payments = [
+        WalletCreditPayment(address=address, amount=8.0, external_reference="0xbatch-1", block_number=1),
+        WalletCreditPayment(address=address, amount=4.0, external_reference="0xbatch-2", block_number=2),
+        WalletCreditPayment(address=other, amount=2.0, external_reference="0xbatch-3", block_number=2),
+    ]
+
+    recorded, failed = await CreditService.add_wallet_credits_batch(CreditTransactionProvider.ltai_base, payments)
+    assert sorted(recorded) == ["0xbatch-1", "0xbatch-2", "0xbatch-3"]
+    assert failed == []
+
+    # LTAI boost applied per payment, both payments land on the same (newly created) user
+    user = await _user_for_address(address)
+    assert await user.get_credit_balance() == (8.0 + 4.0) * 100 / 80
+
+    # Replaying the batch (overlapping block range) records nothing new
+    assert await CreditService.add_wallet_credits_batch(CreditTransactionProvider.ltai_base, payments) == ([], [])
+    assert await user.get_credit_balance() == (8.0 + 4.0) * 100 / 80
+
+
+async def test_add_wallet_credits_batch_isolates_failing_payment():
+    address = "0xBa7c000000000000000000000000000000000007"
+    payments = [
+        WalletCreditPayment(address=address, amount=8.0, external_reference="0xbatch-4", block_number=3),
+        # Rejected by the non-negative amount check, which fails the batch INSERT
+        WalletCreditPayment(address=address, amount=-1.0, external_reference="0xbatch-5", block_number=3),
+    ]
+
+    recorded, failed = await CreditService.add_wallet_credits_batch(CreditTransactionProvider.ltai_base, payments)
+    assert recorded == ["0xbatch-4"]
+    assert failed == ["0xbatch-5"]
+
+    user = await _user_for_address(address)
+    assert await user.get_credit_balance() == 8.0 * 100 / 80
+
+
 async def test_use_credits_reports_full_vs_insufficient():
     address = "0xFee1000000000000000000000000000000000004"
     assert await CreditService.add_credits(CreditTransactionProvider.thirdweb, address, 3.0)
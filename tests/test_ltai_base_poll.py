@@ -0,0 +1,89 @@
+"""Tests for the Base $LTAI polling run and the block range it scans."""
+
+from types import SimpleNamespace
+
+import pytest
+from hexbytes import HexBytes
+
+from src.routes.credits import ltai
+
+SENDER = "0x" + "34" * 20
+
+
+def _event(block_number: int, amount) -> dict:
+    return {
+        "args": {"sender": SENDER, "amount": amount},
+        "transactionHash": HexBytes("0x" + f"{block_number:064x}"),
+        "blockNumber": block_number,
+    }
+
+
+class _StubEth:
+    def __init__(self):
+        self.latest = 0
+
+    @property
+    def block_number(self):
+        async def _get():
+            return self.latest
+
+        return _get()
+
+
+class _StubPaymentProcessed:
+    def __init__(self):
+        self.events: list[dict] = []
+        self.calls: list[tuple[int, int]] = []
+
+    async def get_logs(self, from_block: int, to_block: int):
+        self.calls.append((from_block, to_block))
+        return [e for e in self.events if from_block <= e["blockNumber"] <= to_block]
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    eth = _StubEth()
+    payment_processed = _StubPaymentProcessed()
+
+    async def _get_token_price():
+        return 0.5
+
+    monkeypatch.setattr(ltai, "w3", SimpleNamespace(eth=eth))
+    monkeypatch.setattr(
+        ltai, "payment_processor_contract", SimpleNamespace(events=SimpleNamespace(PaymentProcessed=payment_processed))
+    )
+    monkeypatch.setattr(ltai, "get_token_price", _get_token_price)
+    monkeypatch.setattr(ltai, "_last_scanned_block", None)
+    monkeypatch.setattr(ltai, "_retry_from_block", None)
+    return eth, payment_processed
+
+
+async def test_failed_payment_is_retried_after_a_later_block_is_recorded(chain):
+    eth, payment_processed = chain
+    failing, later = _event(100, "not-an-amount"), _event(105, 10**18)
+    eth.latest = 200
+    payment_processed.events = [failing, later]
+
+    assert await ltai.process_base_ltai_transactions() == [later["transactionHash"].to_0x_hex()]
+
+    # Block 105 is now the highest recorded block, but the next run still goes back to block 100
+    fixed = _event(100, 2 * 10**18)
+    eth.latest = 201
+    payment_processed.events = [fixed, later]
+
+    assert await ltai.process_base_ltai_transactions() == [fixed["transactionHash"].to_0x_hex()]
+    assert payment_processed.calls[-1][0] <= 100
+
+
+async def test_run_without_new_block_skips_get_logs(chain):
+    eth, payment_processed = chain
+    eth.latest = 300
+
+    assert await ltai.process_base_ltai_transactions() == []
+    assert await ltai.process_base_ltai_transactions() == []
+    assert len(payment_processed.calls) == 1
+
+    # Once a block arrives, the range starts a few blocks before the cursor to cover a lagging node
+    eth.latest = 301
+    assert await ltai.process_base_ltai_transactions() == []
+    assert payment_processed.calls[-1] == (301 - ltai.RESCAN_MARGIN_BLOCKS, 301)
@@ -0,0 +1,29 @@
+"""Tests for turning a Base PaymentProcessed event into a wallet credit payment."""
+
+from hexbytes import HexBytes
+
+from src.routes.credits.ltai import payment_from_event
+
+TX_HASH = "0x" + "ab" * 32
+SENDER = "0x" + "12" * 20
+
+
+def _event(amount: int) -> dict:
+    return {
+        "args": {"sender": SENDER, "amount": amount},
+        "transactionHash": HexBytes(TX_HASH),
+        "blockNumber": 30_000_000,
+    }
+
+
+def test_external_reference_is_single_0x_prefixed_hash():
+    payment = payment_from_event(_event(10**18), token_price=0.5)
+
+    assert payment.external_reference == TX_HASH
+    assert payment.block_number == 30_000_000
+
+
+def test_amount_is_usd_value_of_the_ltai_paid():
+    payment = payment_from_event(_event(3 * 10**18), token_price=0.5)
+
+    assert payment.amount == 1.5
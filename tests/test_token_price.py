@@ -0,0 +1,66 @@
+"""Tests for the short-lived Coingecko price cache."""
+
+import time
+
+import pytest
+
+from src.utils import token
+
+
+class _StubResponse:
+    def __init__(self, data: dict):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class _StubClient:
+    def __init__(self, prices: dict[str, float]):
+        self.prices = prices
+        self.calls: list[str] = []
+
+    async def get(self, url: str):
+        self.calls.append(url)
+        coingecko_id = url.split("ids=")[1].split("&")[0]
+        return _StubResponse({coingecko_id: {"usd": self.prices[coingecko_id]}})
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    client = _StubClient({"libertai": 0.5, "solana": 150.0})
+
+    async def _get_client():
+        return client
+
+    monkeypatch.setattr(token, "_get_async_client", _get_client)
+    monkeypatch.setattr(token, "_price_cache", {})
+    return client
+
+
+async def test_price_is_reused_within_ttl(stub_client):
+    assert await token.get_token_price() == 0.5
+    assert await token.get_token_price() == 0.5
+    assert len(stub_client.calls) == 1
+
+
+async def test_price_is_cached_per_asset(stub_client):
+    assert await token.get_token_price() == 0.5
+    assert await token.get_sol_token_price() == 150.0
+    assert len(stub_client.calls) == 2
+
+
+async def test_price_is_refetched_after_ttl(stub_client):
+    token._price_cache["libertai"] = (time.monotonic() - token.PRICE_CACHE_TTL_SECONDS, 0.4)
+    assert await token.get_token_price() == 0.5
+    assert len(stub_client.calls) == 1
+
+
+async def test_invalid_price_is_not_cached(stub_client):
+    stub_client.prices["libertai"] = 0
+    with pytest.raises(ValueError):
+        await token.get_token_price()
+    assert token._price_cache == {}
@@ -0,0 +1,68 @@
+"""Transaction history is built from plain column rows, newest first.
+
+Runs the real handler against the committed test DB, so the test cleans up its own rows.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from src.interfaces.credits import CreditTransactionProvider, CreditTransactionStatus
+from src.models.base import AsyncSessionLocal
+from src.models.credit_transaction import CreditTransaction
+from src.models.user import User
+from src.routes.credits.general import get_transaction_history
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_transaction_history_lists_user_rows_newest_first():
+    now = datetime.now()
+    async with AsyncSessionLocal() as db:
+        user = User(email=f"history-{uuid.uuid4().hex}@example.com")
+        other = User(email=f"history-other-{uuid.uuid4().hex}@example.com")
+        db.add_all([user, other])
+        await db.flush()
+        older = CreditTransaction(
+            user_id=user.id,
+            amount=5.0,
+            amount_left=2.0,
+            provider=CreditTransactionProvider.voucher,
+            external_reference=f"voucher-{uuid.uuid4().hex}",
+            expired_at=now + timedelta(days=30),
+        )
+        older.created_at = now - timedelta(days=1)
+        newer = CreditTransaction(
+            user_id=user.id,
+            amount=10.0,
+            amount_left=10.0,
+            provider=CreditTransactionProvider.revolut,
+            status=CreditTransactionStatus.pending,
+        )
+        newer.created_at = now
+        foreign = CreditTransaction(
+            user_id=other.id, amount=1.0, amount_left=1.0, provider=CreditTransactionProvider.voucher
+        )
+        db.add_all([older, newer, foreign])
+        await db.commit()
+        user_ids = [user.id, other.id]
+
+    try:
+        response = await get_transaction_history(user=user)
+
+        assert [tx.id for tx in response.transactions] == [str(newer.id), str(older.id)]
+        first, second = response.transactions
+        assert first.provider == CreditTransactionProvider.revolut
+        assert first.status == CreditTransactionStatus.pending
+        assert first.external_reference is None
+        assert second.external_reference == older.external_reference
+        assert (second.amount, second.amount_left) == (5.0, 2.0)
+        assert second.expired_at == older.expired_at
+        assert second.is_active is True
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(CreditTransaction).where(CreditTransaction.user_id.in_(user_ids)))
+            await db.execute(delete(User).where(User.id.in_(user_ids)))
+            await db.commit()
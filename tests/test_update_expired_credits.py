@@ -0,0 +1,79 @@
+"""The hourly expiry job deactivates past-expiration credits in one statement.
+
+Runs the real handler against the committed test DB, so the test cleans up its own rows.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select
+
+from src.interfaces.credits import CreditTransactionProvider
+from src.models.base import AsyncSessionLocal
+from src.models.credit_transaction import CreditTransaction
+from src.models.user import User
+from src.routes.credits.general import update_expired_credit_transactions
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_update_expired_deactivates_only_past_expirations():
+    now = datetime.now()
+    expired_reference = f"expired-{uuid.uuid4().hex}"
+    async with AsyncSessionLocal() as db:
+        user = User(email=f"expiry-{uuid.uuid4().hex}@example.com")
+        db.add(user)
+        await db.flush()
+        expired = CreditTransaction(
+            user_id=user.id,
+            amount=5.0,
+            amount_left=5.0,
+            provider=CreditTransactionProvider.voucher,
+            external_reference=expired_reference,
+            expired_at=now - timedelta(days=1),
+        )
+        still_valid = CreditTransaction(
+            user_id=user.id,
+            amount=5.0,
+            amount_left=5.0,
+            provider=CreditTransactionProvider.voucher,
+            expired_at=now + timedelta(days=1),
+        )
+        never_expires = CreditTransaction(
+            user_id=user.id, amount=5.0, amount_left=5.0, provider=CreditTransactionProvider.voucher
+        )
+        db.add_all([expired, still_valid, never_expires])
+        await db.commit()
+        user_id = user.id
+        ids = {"expired": expired.id, "still_valid": still_valid.id, "never_expires": never_expires.id}
+
+    try:
+        response = await update_expired_credit_transactions()
+
+        reported = {tx.id: tx for tx in response.transactions}
+        assert str(ids["expired"]) in reported
+        assert reported[str(ids["expired"])].external_reference == expired_reference
+        assert str(ids["still_valid"]) not in reported
+        assert str(ids["never_expires"]) not in reported
+        assert response.updated_count == len(response.transactions)
+
+        async with AsyncSessionLocal() as db:
+            rows = (
+                await db.execute(
+                    select(CreditTransaction.id, CreditTransaction.is_active).where(
+                        CreditTransaction.user_id == user_id
+                    )
+                )
+            ).all()
+        active = {row.id: row.is_active for row in rows}
+        assert active == {ids["expired"]: False, ids["still_valid"]: True, ids["never_expires"]: True}
+
+        # Already-deactivated rows aren't reported again
+        again = await update_expired_credit_transactions()
+        assert str(ids["expired"]) not in {tx.id for tx in again.transactions}
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(CreditTransaction).where(CreditTransaction.user_id == user_id))
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()